@@ -11,6 +11,7 @@ Uso:
     max_login = settings.RATE_LIMIT_LOGIN_MAX
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import SecretStr, field_validator
 from typing import Optional
@@ -18,6 +19,30 @@ from typing import Optional
 from config.environments import Environment, get_config
 
 
+# Conversión de URLs memoizada por DATABASE_URL: si la URL cambia
+# (p. ej. en tests) se recalcula, si no se reutiliza el resultado.
+@lru_cache(maxsize=8)
+def _to_async_url(url: str) -> str:
+    """Convierte una URL sync a su driver async si es necesario."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://")
+    elif url.startswith("sqlite:///"):
+        return url.replace("sqlite:///", "sqlite+aiosqlite:///")
+
+    return url
+
+
+@lru_cache(maxsize=8)
+def _to_sync_url(url: str) -> str:
+    """Convierte una URL async a sync para Alembic."""
+    if "asyncpg" in url:
+        return url.replace("postgresql+asyncpg://", "postgresql://")
+    elif "aiosqlite" in url:
+        return url.replace("sqlite+aiosqlite:///", "sqlite:///")
+
+    return url
+
+
 class Settings(BaseSettings):
     """
     Configuración del sistema con soporte multi-entorno.
@@ -179,27 +204,11 @@ class Settings(BaseSettings):
 
     def get_async_database_url(self) -> str:
         """Retorna la URL de base de datos para async"""
-        url = self.DATABASE_URL
-
-        # Convertir URL sync a async si es necesario
-        if url.startswith("postgresql://"):
-            return url.replace("postgresql://", "postgresql+asyncpg://")
-        elif url.startswith("sqlite:///"):
-            return url.replace("sqlite:///", "sqlite+aiosqlite:///")
-
-        return url
+        return _to_async_url(self.DATABASE_URL)
 
     def get_sync_database_url(self) -> str:
         """Retorna la URL de base de datos para sync (migraciones)"""
-        url = self.DATABASE_URL
-
-        # Convertir URL async a sync para Alembic
-        if "asyncpg" in url:
-            return url.replace("postgresql+asyncpg://", "postgresql://")
-        elif "aiosqlite" in url:
-            return url.replace("sqlite+aiosqlite:///", "sqlite:///")
-
-        return url
+        return _to_sync_url(self.DATABASE_URL)
 
     def get_allowed_image_types(self) -> list:
         """Retorna lista de tipos de imagen permitidos."""